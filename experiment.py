@@ -26,8 +26,8 @@ if len(tf.get_default_graph()._nodes_by_id.keys()) > 0:
                        'of the graph.')
 
 from src import datatools
-from src.networks import cnn
-from src.oracle import ask_oracle
+from src.networks import cnn, reset_cnn
+from src.oracle import get_most_uncertain
 from src.acquisition_function import run_acquisition_function, ACQUISITION_FUNCTIONS_TEXT
 from src.policies import policy_parser
 
@@ -78,6 +78,9 @@ model = cnn(input_shape=x_train.shape[1:],
             train_size=x_train.shape[0],
             weight_constant=weight_constant)
 
+# the model is reset to these weights before every retraining
+initial_weights = model.get_weights()
+
 history = model.fit(x_train, y_train,
                     batch_size=batch_size,
                     epochs=args.epochs) 
@@ -102,6 +105,9 @@ logger.record_test_metrics(test_loss, test_accuracy)
 prev_loss = val_loss
 prev_acc = val_accuracy
 
+# the pool stays fixed, points that have been revealed are masked out
+available_pool = np.ones(x_pool.shape[0], dtype=bool)
+
 
 """
 START COLLECTING A NEW DATASET
@@ -110,7 +116,8 @@ for i in range(acquisition_iterations):
     print('Acquisition iteration: ', i)
 
     # get a subset of the pool:
-    pool_without_subset, (x_pool_subset, y_pool_subset) = datatools.get_pool_subset(x_pool, y_pool, pool_subset_size)
+    pool_subset_indices = datatools.get_pool_subset_indices(available_pool, pool_subset_size)
+    x_pool_subset = x_pool[pool_subset_indices]
     
     # get the acquisition function to use:
     acquisition_function_name = policy.get_acquisition_function()
@@ -123,21 +130,16 @@ for i in range(acquisition_iterations):
                                                      dropout_iterations=dropout_iterations)
     
     # ask the oracle for labels of the top 'n_queries' uncertain points
-    new_data_for_training, pool_subset_updated = ask_oracle(uncertainty_estimates,
-                                                            n_queries,
-                                                            x_pool_subset,
-                                                            y_pool_subset,
-                                                            n_classes=n_classes)
+    revealed_indices = pool_subset_indices[get_most_uncertain(uncertainty_estimates, n_queries)]
+    available_pool[revealed_indices] = False
+    new_data_for_training = (x_pool[revealed_indices], y_pool[revealed_indices])
 
-    # x_train, y_train = datatools.combine_datasets(new_data_for_training, (x_train, y_train))
     x_train, y_train = datatools.combine_datasets((x_train, y_train), new_data_for_training)
-    x_pool, y_pool = datatools.combine_datasets(pool_without_subset, pool_subset_updated)
 
-    model = cnn(input_shape=x_train.shape[1:],
-                output_classes=n_classes,
-                bayesian= args.model == 'bayesian',
-                train_size=x_train.shape[0],
-                weight_constant=weight_constant)
+    model = reset_cnn(model,
+                      initial_weights,
+                      train_size=x_train.shape[0],
+                      weight_constant=weight_constant)
 
     history = model.fit(x_train, y_train,
                         batch_size=batch_size,
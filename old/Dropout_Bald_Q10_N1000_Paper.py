@@ -12,8 +12,7 @@ from six.moves import range
 import numpy as np
 import scipy as sp
 from keras import backend as K  
-import random
-random.seed(5001)
+np.random.seed(5001)
 import scipy.io
 import matplotlib.pyplot as plt
 from keras.regularizers import l2, activity_l2
@@ -61,7 +60,7 @@ for e in range(Experiments):
 	X_train_All = X_train_All.reshape(X_train_All.shape[0], 1, img_rows, img_cols)
 	X_test = X_test.reshape(X_test.shape[0], 1, img_rows, img_cols)
 
-	random_split = np.asarray(random.sample(range(0,X_train_All.shape[0]), X_train_All.shape[0]))
+	random_split = np.random.permutation(X_train_All.shape[0])
 
 	X_train_All = X_train_All[random_split, :, :, :]
 	y_train_All = y_train_All[random_split]
@@ -221,7 +220,7 @@ for e in range(Experiments):
 		#take subset of Pool Points for Test Time Dropout 
 		#and do acquisition from there
 		pool_subset = 2000
-		pool_subset_dropout = np.asarray(random.sample(range(0,X_Pool.shape[0]), pool_subset))
+		pool_subset_dropout = np.random.choice(X_Pool.shape[0], pool_subset, replace=False)
 		X_Pool_Dropout = X_Pool[pool_subset_dropout, :, :, :]
 		y_Pool_Dropout = y_Pool[pool_subset_dropout]
 
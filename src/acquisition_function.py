@@ -1,32 +1,81 @@
 import math
 import numpy as np
 import os
-import random
+from scipy.special import xlogy
 from scipy.stats import mode
 
+def entropy(p, axis=-1, out=None):
+    """
+    Returns the entropy (in bits) of the categorical distributions in `p`
+    :param p: the probabilities, the classes along `axis`
+    :param axis: the axis to sum over
+    :param out: array to write p*log(p) to instead of allocating a new one,
+                can be `p` itself if the probabilities are no longer needed
+
+    :return: the entropy of each distribution
+    """
+    # xlogy(0, 0) is 0 so points with zero probability contribute no entropy
+    return - np.sum(xlogy(p, p, out=out), axis=axis) / np.log(2)
+
+def _mc_dropout_function(model, dropout_iterations):
+    """
+    Returns a backend function that tiles a batch `dropout_iterations` times
+    inside the graph and runs the model on all the copies at once.
+    The functions are cached on the model so their graph is only built once.
+    """
+    from keras import backend as K
+
+    if not hasattr(model, '_mc_dropout_functions'):
+        model._mc_dropout_functions = {}
+
+    if dropout_iterations not in model._mc_dropout_functions:
+        x = model.inputs[0]
+        x_tiled = K.tile(x, [dropout_iterations] + [1] * (K.ndim(x) - 1))
+        inputs = [x]
+        if model.uses_learning_phase and not isinstance(K.learning_phase(), int):
+            inputs.append(K.learning_phase())
+        model._mc_dropout_functions[dropout_iterations] = K.function(inputs, [model(x_tiled)])
+
+    return model._mc_dropout_functions[dropout_iterations]
+
+def mc_dropout_predictions(X_Pool_Dropout, model, batch_size=32, dropout_iterations=10):
+    """
+    Returns the predictions of `dropout_iterations` stochastic forward passes
+    over the pool. Every batch is sent to the device once and tiled there so
+    that all the passes run together, every copy of a point gets its own dropout mask.
+    :param X_Pool_Dropout: the Pool set to use
+    :param model: the model to use
+    :param batch_size: the number of pool points per batch
+    :param dropout_iterations: the number of dropout iterations to use
+
+    :return: the predictions with shape (dropout_iterations, n_points, num_classes)
+    """
+    mc_dropout_function = _mc_dropout_function(model, dropout_iterations)
+    uses_learning_phase = len(mc_dropout_function.inputs) > 1
+    n_points = X_Pool_Dropout.shape[0]
+
+    # the predictions of every batch are written straight into a single buffer
+    dropout_scores = np.empty((dropout_iterations, n_points, model.output_shape[-1]), dtype='float32')
+
+    for start in range(0, n_points, batch_size):
+        X_batch = X_Pool_Dropout[start:start+batch_size]
+        ins = [X_batch, 0.] if uses_learning_phase else [X_batch]
+        batch_scores = mc_dropout_function(ins)[0]
+        dropout_scores[:, start:start+X_batch.shape[0]] = batch_scores.reshape(dropout_iterations, X_batch.shape[0], -1)
+
+    return dropout_scores
+
 def bald(X_Pool_Dropout, num_classes, model, batch_size=32, dropout_iterations=10):
 
-    score_All = np.zeros(shape=(X_Pool_Dropout.shape[0], num_classes))
-    All_Entropy_Dropout = np.zeros(shape=X_Pool_Dropout.shape[0])
+    dropout_scores = mc_dropout_predictions(X_Pool_Dropout, model, batch_size, dropout_iterations)
+
+    #computing Entropy_Average_Pi
+    Entropy_Average_Pi = entropy(np.mean(dropout_scores, axis=0))
+
+    #computing Average_Entropy
+    # the scores are not needed anymore so they are overwritten in place
+    Average_Entropy = np.mean(entropy(dropout_scores, out=dropout_scores), axis=0)
 
-    for d in range(dropout_iterations):
-        dropout_score = model.predict(X_Pool_Dropout, batch_size=batch_size, verbose=1)
-        #computing Entropy_Average_Pi
-        score_All = score_All + dropout_score
-        #computing Average_Entropy
-        dropout_score_log = np.log2(dropout_score)
-        Entropy_Compute = - np.multiply(dropout_score, dropout_score_log)
-        Entropy_Per_Dropout = np.sum(Entropy_Compute, axis=1)
-        All_Entropy_Dropout = All_Entropy_Dropout + Entropy_Per_Dropout 
-
-
-    Avg_Pi = np.divide(score_All, dropout_iterations)
-    Log_Avg_Pi = np.log2(Avg_Pi)
-    Entropy_Avg_Pi = - np.multiply(Avg_Pi, Log_Avg_Pi)
-    Entropy_Average_Pi = np.sum(Entropy_Avg_Pi, axis=1)
-
-    G_X = Entropy_Average_Pi
-    Average_Entropy = np.divide(All_Entropy_Dropout, dropout_iterations)
     uncertain_pool_points = Entropy_Average_Pi - Average_Entropy
 
     return uncertain_pool_points
@@ -41,37 +90,19 @@ def negative_bald(X_Pool_Dropout, num_classes, model, batch_size=32, dropout_ite
 
 
 def maxentropy(X_Pool_Dropout, num_classes, model, batch_size=32, dropout_iterations=10):
-    score_All = np.zeros(shape=(X_Pool_Dropout.shape[0], num_classes))
-    for d in range(dropout_iterations):
-        dropout_score = model.predict(X_Pool_Dropout,batch_size=batch_size, verbose=1)
-        score_All = score_All + dropout_score
+    dropout_scores = mc_dropout_predictions(X_Pool_Dropout, model, batch_size, dropout_iterations)
 
-    Avg_Pi = np.divide(score_All, dropout_iterations)
-    Log_Avg_Pi = np.log2(Avg_Pi)
-    Entropy_Avg_Pi = - np.multiply(Avg_Pi, Log_Avg_Pi)
-    Entropy_Average_Pi = np.sum(Entropy_Avg_Pi, axis=1)
-
-    uncertain_pool_points = Entropy_Average_Pi
+    uncertain_pool_points = entropy(np.mean(dropout_scores, axis=0))
 
     return uncertain_pool_points
 
 def varratio(X_Pool_Dropout, num_classes, model, batch_size=32, dropout_iterations=10):
-    All_Dropout_Classes = np.zeros(shape=(X_Pool_Dropout.shape[0],1))
+    dropout_scores = mc_dropout_predictions(X_Pool_Dropout, model, batch_size, dropout_iterations)
+    All_Dropout_Classes = np.argmax(dropout_scores, axis=2)
 
-    for d in range(dropout_iterations):
-        dropout_classes = model.predict_classes(X_Pool_Dropout,batch_size=batch_size, verbose=1)
-        dropout_classes = np.array([dropout_classes]).T
-        All_Dropout_Classes = np.append(All_Dropout_Classes, dropout_classes, axis=1)
-
-    uncertain_pool_points = np.zeros(shape=(X_Pool_Dropout.shape[0]))
-
-    for t in range(X_Pool_Dropout.shape[0]):
-        L = np.array([0])
-        for d_iter in range(dropout_iterations):
-            L = np.append(L, All_Dropout_Classes[t, d_iter+1])            
-        Predicted_Class, Mode = mode(L[1:])
-        v = np.array(  [1 - Mode/float(dropout_iterations)])
-        uncertain_pool_points[t] = v
+    # the number of dropout iterations that agree with the most frequent class
+    Predicted_Class, Mode = mode(All_Dropout_Classes, axis=0)
+    uncertain_pool_points = 1 - np.reshape(Mode, -1) / float(dropout_iterations)
 
     return uncertain_pool_points
 
@@ -1,7 +1,6 @@
 import keras
 from keras import backend as K
 import numpy as np
-import random
 
 def get_mnist():
     """
@@ -56,8 +55,7 @@ def get_cifar10():
     return (x_train, y_train), (x_test, y_test)
 
 def prep(x, y):
-    x = x.astype('float32')
-    x /= 255
+    # x is kept as uint8, the networks normalize it themselves
     n_classes = 10
     y = keras.utils.to_categorical(y, n_classes)
     return x, y
@@ -83,6 +81,26 @@ def get_valid_data(x_train, y_train, valid_ratio=0.1):
     return (x_train, y_train), (x_valid, y_valid)
 
 
+def take_k_per_class(y, k, num_classes=None):
+    """
+    Returns the indices of the first `k` points of every class
+    :param y: the integer labels
+    :param k: the number of points to take per class
+    :param num_classes: the number of classes, inferred from `y` if None
+    :return: the indices, grouped by class in increasing order
+    """
+    labels = y.reshape(-1)
+    if num_classes is None:
+        num_classes = np.max(labels)+1
+
+    # a stable sort keeps the points of each class in their original order
+    order = np.argsort(labels, kind='mergesort')
+    sorted_labels = labels[order]
+    starts = np.searchsorted(sorted_labels, np.arange(num_classes), side='left')
+    ends = np.searchsorted(sorted_labels, np.arange(num_classes), side='right')
+
+    return np.concatenate([order[start:min(start+k, end)] for start, end in zip(starts, ends)])
+
 def get_pool_data(x, y):
     """
     Creates a pool set
@@ -91,20 +109,10 @@ def get_pool_data(x, y):
     :param initial_train_point: the starting position to start selecting
     """
 
-    y_classes = np.max(y)+1
+    idxs = take_k_per_class(y, 2) # indexes of data put in the training set
 
-    xs = [] # xs to put in the training set
-    ys = [] # ys to put in the training set
-    idxs = [] # indexes of data put in the training set
-    for y_class in range(y_classes):
-        idx = np.array(  np.where(y == y_class) ).T
-        idx = idx[0:2, 0]
-        xs.append(x[idx])
-        ys.append(y[idx])
-        idxs.extend(idx)
-
-    x_train = np.concatenate(xs, axis=0)
-    y_train = np.concatenate(ys, axis=0)
+    x_train = x[idxs]
+    y_train = y[idxs]
 
     x_pool = np.delete(x, idxs, axis=0)
     y_pool = np.delete(y, idxs, axis=0)
@@ -146,13 +154,25 @@ def get_pool_subset(X_pool, Y_pool, subset_size=2000):
     :return: (X_pool_subset, Y_pool_subset) a subset of `sub
     set_size` points from X_pool
     """
-    subset_indices = np.asarray(random.sample(range(0,X_pool.shape[0]), subset_size))
+    subset_indices = np.random.choice(X_pool.shape[0], subset_size, replace=False)
     X_pool_subset = X_pool[subset_indices]
     Y_pool_subset = Y_pool[subset_indices]
     X_pool = np.delete(X_pool, subset_indices, axis=0)
     Y_pool = np.delete(Y_pool, subset_indices, axis=0)
     return (X_pool, Y_pool), (X_pool_subset, Y_pool_subset)
 
+def get_pool_subset_indices(available_pool, subset_size=2000):
+    """
+    Samples the indices of a subset of the pool data for
+    running dropout and getting uncertainties
+    :param available_pool: boolean mask over the complete pool, False for
+                           points that have already been revealed
+    :param subset_size: the size of the subset
+    :return: the indices of `subset_size` available points of the pool
+    """
+    available_indices = np.flatnonzero(available_pool)
+    return np.random.choice(available_indices, subset_size, replace=False)
+
 def combine_datasets(dataset_1, dataset_2):
     x1, y1 = dataset_1
     x2, y2 = dataset_2
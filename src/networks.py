@@ -1,4 +1,5 @@
 import keras
+import numpy as np
 
 from keras.models import Sequential
 from keras.layers import Dense, Dropout, Flatten
@@ -19,20 +20,21 @@ def cnn(input_shape,
         #kernel_regularizer=None,
         # activity_regularizer=regularizers.l1(0.01),
         activity_regularizer=None,
-        optimizer=Adam(lr=0.001, decay=1e-6),
+        optimizer=None,
         bayesian=True,
         train_size=20,
         weight_constant=1):
 
     """
     Returns a CNN that can be used for mnist
-    :param input_shape: the size of the input
+    :param input_shape: the size of the input (images are expected as uint8 in [0, 255])
     :param conv_kernel_size: size of the kernel for the convolution layers
     :param n_filters: the number of filters per convolution layer
     :param pool_size: size of the pooling operation
     :param kernel_regularizer: the regularizer to use for the weights of the dense layer
     :param activity_regularizer: the regularizer to use for the activations of a network
-    :param optimizer: the optimizer to use (must be a keras.optimizers.Optimizer instance)
+    :param optimizer: the optimizer to use (must be a keras.optimizers.Optimizer instance),
+                      a new Adam optimizer is created for every network if None
     :param loss: the loss function to use 
     :returns: keras.models.Model instance that has been compiled.
     """
@@ -40,12 +42,23 @@ def cnn(input_shape,
         print('Using bayesian network')
     else:
         print('Using deterministic network')
-        
+
+    # the weight decay depends on the size of the training set, keep it in a
+    # variable so that it can be updated without rebuilding the network
+    weight_decay = K.variable(weight_constant / float(train_size), name='weight_decay')
+
+    if optimizer is None:
+        optimizer = Adam(lr=0.001, decay=1e-6)
+
     model = Sequential()
+    # images are fed as uint8 and normalized on the device, this
+    # quarters the amount of data copied for every batch
+    model.add(Lambda(lambda x: K.cast(x, K.floatx()) / 255.,
+                     input_shape=input_shape,
+                     dtype='uint8'))
     model.add(Conv2D(n_filters,
                      kernel_size=conv_kernel_size,
-                     activation='relu',
-                     input_shape=input_shape))
+                     activation='relu'))
     model.add(Conv2D(n_filters*2, conv_kernel_size, activation='relu'))
     model.add(MaxPooling2D(pool_size=pool_size))
     
@@ -57,7 +70,7 @@ def cnn(input_shape,
     model.add(Flatten())
     model.add(Dense(128,
                     activation='relu',
-                    kernel_regularizer=regularizers.l2(weight_constant / float(train_size)),
+                    kernel_regularizer=lambda weights: weight_decay * K.sum(K.square(weights)),
                     activity_regularizer=activity_regularizer))
 
     if bayesian:
@@ -69,5 +82,26 @@ def cnn(input_shape,
     model.compile(loss=categorical_crossentropy,
                   optimizer=optimizer,
                   metrics=['accuracy'])
+    model.weight_decay = weight_decay
+
+    return model
+
+def reset_cnn(model, initial_weights, train_size=20, weight_constant=1):
+    """
+    Resets a CNN returned by `cnn` so that it can be retrained from scratch
+    without building and compiling a new graph
+    :param model: the model to reset
+    :param initial_weights: the weights to reset to (from `model.get_weights()`)
+    :param train_size: the size of the new training set
+    :param weight_constant: the weight constant for the L2 regularizer
+    :returns: the same keras.models.Model instance, reset.
+    """
+    model.set_weights(initial_weights)
+    K.set_value(model.weight_decay, weight_constant / float(train_size))
+
+    # the optimizer state (iterations and moment estimates) is only created
+    # once the model has been trained, a fresh optimizer has them all as zeros
+    # so the learning rate decay and bias correction start over as well
+    K.batch_set_value([(w, np.zeros(K.int_shape(w))) for w in model.optimizer.weights])
 
     return model
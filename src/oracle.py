@@ -5,7 +5,6 @@ it has never seen
 """
 
 from sklearn.neighbors import KDTree, KNeighborsClassifier
-import keras
 import numpy as np
 import sys
 sys.path.append('ssl_vae')
@@ -19,21 +18,24 @@ def convert_1d_to_2d(X, img_dim):
     return X.reshape(-1, img_dim, img_dim, 1)
 
 class KNOracle(object):
-    def __init__(self, X_pool_known, Y_pool_known, n_neighbors=5, n_jobs=1):
+    def __init__(self, X_pool_known, Y_pool_known, n_neighbors=5, n_jobs=-1, algorithm='ball_tree'):
         """
         Implements an Nearest Neighbour Oracle
         :param X_pool_known: the set of x training data
         :param Y_pool_known: the set of labels for the training data
         :param n_neighbours: the number of neighbours to take points over
         :param n_jobs: number of jobs for parallelization  
+        :param algorithm: the algorithm used to find the neighbours, a ball tree
+                          scales better than the default kd tree on flattened images
         """
-        classifier = KNeighborsClassifier(n_neighbors=5, n_jobs=1)
+        classifier = KNeighborsClassifier(n_neighbors=n_neighbors, n_jobs=n_jobs, algorithm=algorithm)
         classifier.fit(convert_2d_to_1d(X_pool_known), Y_pool_known)
         self.classifier = classifier
 
     def assign_nearest_available_label(self, X):
         """
         Returns the nearest neighbour label for the data provided
+        all the points are labelled with a single batched neighbour query
         :param X: the data to assign labels to
         :return: the Y's assigned to X
         """
@@ -65,8 +67,8 @@ class SSOracle(object):
         Initialize a semi-supervised VAE
         Train it on L+U data
         """
-            self.ss_VAE =ssl_vae(X_labeled,Y_labeled,X_unlabeled)
-            self.ss_VAE.train()
+        self.ss_VAE =ssl_vae(X_labeled,Y_labeled,X_unlabeled)
+        self.ss_VAE.train()
 
     def assign_best_label(self,X):
         """
@@ -74,6 +76,18 @@ class SSOracle(object):
         """
         return self.ss_VAE.predict(X).numpy()
 
+def get_most_uncertain(pool_uncertainties, n_queries):
+    """
+    Returns the indices of the n_queries most uncertain points
+    :param pool_uncertainties: the uncertainty for each point
+    :param n_queries: number of points to ask for
+    :return: the indices of the points, most uncertain first
+    """
+    pool_uncertainties = pool_uncertainties.flatten()
+    # only the n_queries most uncertain points need to be sorted
+    most_uncertain = np.argpartition(-pool_uncertainties, n_queries - 1)[:n_queries]
+    return most_uncertain[np.argsort(-pool_uncertainties[most_uncertain])]
+
 def ask_oracle(pool_uncertainties, n_queries, X_pool, Y_pool, n_classes=10):
     """
     An oracle that reveals the labels of 
@@ -85,9 +99,8 @@ def ask_oracle(pool_uncertainties, n_queries, X_pool, Y_pool, n_classes=10):
     :return: (X_revealed, Y_revealed) the n_queries most uncertain points with labels revealed
     :return: (X_pool_prime, Y_pool_prime) the pool with revealed points removed.
     """
-    pool_uncertainties = pool_uncertainties.flatten()
     # these points need to be revealed to the learner
-    pool_to_be_revealed = pool_uncertainties.argsort()[-n_queries:][::-1]
+    pool_to_be_revealed = get_most_uncertain(pool_uncertainties, n_queries)
 
     X_revealed = X_pool[pool_to_be_revealed]
     Y_revealed = Y_pool[pool_to_be_revealed] 
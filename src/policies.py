@@ -1,4 +1,3 @@
-import random
 import numpy as np
 
 class Policy(object):
@@ -29,7 +28,7 @@ class RandomPolicy(Policy):
     Returns a random acquisition function when called
     """
     def get_acquisition_function(self, *args, **kwargs):
-        return random.choice(self.acquisition_functions)
+        return self.acquisition_functions[np.random.randint(len(self.acquisition_functions))]
 
 class BanditPolicy(Policy):
     """
@@ -1,7 +1,20 @@
 import torch
-from torch.autograd import Variable
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.nn import init
+
+
+class XavierLinear(nn.Linear):
+    """
+    Linear layer with Xavier normal initialised
+    weights and zero biases.
+    """
+    def reset_parameters(self):
+        # called by nn.Linear.__init__, so the default
+        # initialisation is replaced rather than overwritten
+        init.xavier_normal_(self.weight.data)
+        if self.bias is not None:
+            self.bias.data.zero_()
 
 
 class StochasticGaussian(nn.Module):
@@ -11,8 +24,8 @@ class StochasticGaussian(nn.Module):
     """
     def __init__(self, input_dim, z_dim):
         super(StochasticGaussian, self).__init__()
-        self.mu = nn.Linear(input_dim, z_dim)
-        self.log_var = nn.Linear(input_dim, z_dim)
+        self.mu = XavierLinear(input_dim, z_dim)
+        self.log_var = XavierLinear(input_dim, z_dim)
 
     def forward(self, x):
         """
@@ -26,7 +39,7 @@ class StochasticGaussian(nn.Module):
         mu = self.mu(x)
         log_var = self.log_var(x)
 
-        epsilon = Variable(torch.randn(*mu.size()))
+        epsilon = torch.randn_like(mu)
         std = torch.exp(0.5 * log_var)
 
         z = mu + std * epsilon
@@ -43,5 +56,5 @@ class StochasticMultinomial(nn.Module):
 
     def forward(self, x):
         pi = x
-        x = F.softmax(pi)
+        x = F.softmax(pi, dim=-1)
         return x
\ No newline at end of file
@@ -30,9 +30,8 @@ def discrete_uniform_prior(x):
     """
     [batch_size, n] = x.size()
 
-    # Uniform prior over y
+    # Uniform prior over y, already normalised so no softmax is needed
     prior = (1. / n) * torch.ones(batch_size, n)
-    prior = F.softmax(prior)
 
     cross_entropy = -torch.sum(x * torch.log(prior + EPSILON), dim=1)
 
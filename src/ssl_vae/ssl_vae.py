@@ -81,7 +81,7 @@ class ssl_vae:
                 self.optimizer_m1.zero_grad()
         
             if self.verbose and epoch % 10== 0:
-                l = self.L.data[0]
+                l = self.L.item()
                 print("Epoch: {0:} loss: {1:.3f}".format(epoch, l))
 
          
@@ -116,7 +116,7 @@ class ssl_vae:
                 self.optimizer_m2.zero_grad()
                 
             if self.verbose and epoch % 10== 0:
-                l = self.loss.data[0]
+                l = self.loss.item()
                 print("Epoch: {0:} loss: {1:.3f}".format(epoch, l))
 
     def predict(self,X):
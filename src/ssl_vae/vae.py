@@ -9,9 +9,8 @@ to a classifier with VAE latent representation as input.
 
 import torch.nn as nn
 import torch.nn.functional as F
-from torch.nn import init
 
-from layers import StochasticGaussian
+from layers import StochasticGaussian, XavierLinear
 
 
 class Encoder(nn.Module):
@@ -32,7 +31,7 @@ class Encoder(nn.Module):
 
         [x_dim, h_dim, z_dim] = dims
         neurons = [x_dim, *h_dim]
-        linear_layers = [nn.Linear(neurons[i-1], neurons[i]) for i in range(1, len(neurons))]
+        linear_layers = [XavierLinear(neurons[i-1], neurons[i]) for i in range(1, len(neurons))]
 
         self.hidden = nn.ModuleList(linear_layers)
         self.sample = StochasticGaussian(h_dim[-1], z_dim)
@@ -62,10 +61,10 @@ class Decoder(nn.Module):
 
         [z_dim, h_dim, x_dim] = dims
         neurons = [z_dim, *h_dim]
-        linear_layers = [nn.Linear(neurons[i-1], neurons[i]) for i in range(1, len(neurons))]
+        linear_layers = [XavierLinear(neurons[i-1], neurons[i]) for i in range(1, len(neurons))]
 
         self.hidden = nn.ModuleList(linear_layers)
-        self.reconstruction = nn.Linear(h_dim[-1], x_dim)
+        self.reconstruction = XavierLinear(h_dim[-1], x_dim)
         self.output_activation = nn.Sigmoid()
 
     def forward(self, x):
@@ -97,12 +96,6 @@ class VariationalAutoencoder(nn.Module):
         self.encoder = Encoder([x_dim, h_dim, z_dim])
         self.decoder = Decoder([z_dim, list(reversed(h_dim)), x_dim])
 
-        for m in self.modules():
-            if isinstance(m, nn.Linear):
-                init.xavier_normal(m.weight.data)
-                if m.bias is not None:
-                    m.bias.data.zero_()
-
     def forward(self, x):
         z, mu, log_var = self.encoder(x)
         x_hat = self.decoder(z)
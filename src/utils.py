@@ -1,6 +1,5 @@
 import argparse
 import numpy as np
-import random
 import os
 import time
 import json
@@ -0,0 +1,25 @@
+from src.acquisition_function import entropy
+from src.oracle import get_most_uncertain
+import numpy as np
+
+
+def test_entropy_of_certain_prediction():
+	p = np.zeros((1, 10))
+	p[0, 0] = 1
+
+	assert entropy(p)[0] == 0
+
+
+def test_entropy_matches_definition():
+	p = np.random.random((50, 10)) + 1e-3
+	p /= p.sum(axis=1, keepdims=True)
+
+	assert np.allclose(entropy(p), -np.sum(p * np.log2(p), axis=1))
+
+
+def test_get_most_uncertain():
+	pool_uncertainties = np.random.permutation(2000) / 2000.
+
+	for n_queries in [1, 10, 2000]:
+		assert np.all(get_most_uncertain(pool_uncertainties, n_queries) ==
+		              pool_uncertainties.argsort()[-n_queries:][::-1])
@@ -23,4 +23,24 @@ def test_data_pipeline():
 
 	assert pool_x_shape[0] > x_shape[0]
 
-	assert get_shape(training_data)[0][0] == (np.max(original_training_data[1])+1)*2
\ No newline at end of file
+	assert get_shape(training_data)[0][0] == (np.max(original_training_data[1])+1)*2
+
+def test_get_pool_subset_indices():
+
+	available_pool = np.ones(100, dtype=bool)
+	available_pool[:50] = False
+
+	subset_indices = datatools.get_pool_subset_indices(available_pool, 20)
+
+	assert subset_indices.shape[0] == 20
+	assert np.unique(subset_indices).shape[0] == 20
+	assert np.all(available_pool[subset_indices])
+
+
+def test_take_k_per_class():
+
+	y = np.array([3, 1, 0, 1, 3, 0, 1, 3, 0])
+
+	assert list(datatools.take_k_per_class(y, 2)) == [2, 5, 1, 3, 0, 4]
+	# classes with fewer than k points or no points at all
+	assert list(datatools.take_k_per_class(y, 4, num_classes=5)) == [2, 5, 8, 1, 3, 6, 0, 4, 7]
@@ -1,12 +1,29 @@
-from src.networks import cnn
+from src.networks import cnn, reset_cnn
 from src import datatools
 import numpy as np
+from keras import backend as K
 
 def test_cnn():
 
 	assert cnn((32, 32, 1), 10)
 
 
+def test_reset_cnn():
+    train_data, _ = datatools.get_mnist()
+    x_train, y_train = datatools.prep(*train_data)
+    x_train, y_train = x_train[:256], y_train[:256]
+
+    net = cnn((28, 28, 1), 10, train_size=x_train.shape[0])
+    initial_weights = net.get_weights()
+    net.fit(x_train, y_train, batch_size=128, epochs=1, verbose=1)
+
+    net = reset_cnn(net, initial_weights, train_size=2*x_train.shape[0])
+
+    assert all(np.all(w == w0) for w, w0 in zip(net.get_weights(), initial_weights))
+    assert all(np.all(w == 0) for w in K.batch_get_value(net.optimizer.weights))
+    assert np.isclose(K.get_value(net.weight_decay), 1 / float(2*x_train.shape[0]))
+
+
 def test_bayesian_training():
     # use the third return because it has more points
     # _, (x_val, y_val), (x_train, y_train), _ = data_pipeline(valid_ratio=0.1)